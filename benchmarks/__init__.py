@@ -0,0 +1,11 @@
+"""Benchmarks for the Vapi Streamlit app.
+
+Run a benchmark as a module from the repository root:
+
+    python -m benchmarks.import_time                  # startup and per-rerun cost
+    python -m benchmarks.synthetic_data --size 100k   # scratch database for manual testing
+    python -m benchmarks.suite --sizes 1k,100k        # data-layer and page timings as JSON
+    python -m benchmarks.mock_vapi --port 8787        # local mock of the Vapi API
+    python -m benchmarks.load_vapi --customers 2000   # calling throughput against the mock
+    python -m benchmarks.claim_check --workers 8      # concurrent call queue claims, no double claims
+"""
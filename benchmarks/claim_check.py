@@ -0,0 +1,99 @@
+"""Concurrent claim check for the call queue.
+
+Enqueues synthetic entries, then drains the queue with several claimers at
+once. Each claimer calls claim_call_queue_batch() on its own connection, as
+separate app replicas would. Every entry must be claimed exactly once. An
+entry claimed twice would be dialed twice.
+
+The check runs against a scratch SQLite database by default. Point it at a
+PostgreSQL database with --database-url; the queue tables there are emptied
+first, so use a scratch database.
+
+Usage (from the repository root):
+
+    python -m benchmarks.claim_check --workers 8 --entries 5000
+    python -m benchmarks.claim_check --database-url postgresql://localhost/scratch
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Dict, List
+
+from benchmarks.import_time import load_app
+
+def enqueue_entries(app, count: int):
+    """Replace the call queue with `count` pending entries."""
+    now = app.datetime.now().isoformat()
+    conn = app.get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute('DELETE FROM call_queue')
+    cursor.executemany('''
+        INSERT INTO call_queue (batch_id, customer_id, customer_phone, customer_name, assistant_name,
+                                assistant_id, status, enqueued_at)
+        VALUES (?, ?, ?, ?, ?, ?, 'pending', ?)
+    ''', [('claim-check', f"cust_{index:07d}", f"+1555{index:07d}", f"Claim Check {index}",
+           'Claim Check', 'claim-check', now) for index in range(count)])
+    conn.commit()
+    conn.close()
+
+def run_claimers(app, workers: int, batch_size: int) -> Dict[int, List[int]]:
+    """Drain the queue from `workers` threads at once; returns the ids each worker claimed."""
+    claimed = {worker: [] for worker in range(workers)}
+    start = threading.Barrier(workers)
+
+    def claimer(worker: int):
+        start.wait()
+        while True:
+            entries = app.claim_call_queue_batch(batch_size)
+            if not entries:
+                return
+            claimed[worker].extend(entry['id'] for entry in entries)
+
+    threads = [threading.Thread(target=claimer, args=(worker,)) for worker in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return claimed
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that concurrent claimers never claim a queue entry twice")
+    parser.add_argument('--database-url', default=None, help="Database to use (default: a scratch SQLite file)")
+    parser.add_argument('--workers', type=int, default=4, help="Concurrent claimers, each on its own connection")
+    parser.add_argument('--entries', type=int, default=2000)
+    parser.add_argument('--batch-size', type=int, default=50)
+    args = parser.parse_args()
+
+    os.environ['METRICS_PORT'] = '0'
+    os.environ['SCHEDULED_JOBS_ENABLED'] = '0'
+
+    with tempfile.TemporaryDirectory() as scratch_dir:
+        app = load_app(args.database_url or f"sqlite:///{os.path.join(scratch_dir, 'claims.db')}")
+        enqueue_entries(app, args.entries)
+
+        started = time.perf_counter()
+        claimed = run_claimers(app, args.workers, args.batch_size)
+        elapsed = time.perf_counter() - started
+
+        counts = Counter(queue_id for ids in claimed.values() for queue_id in ids)
+        duplicates = sum(1 for count in counts.values() if count > 1)
+        conn = app.get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM call_queue WHERE status = 'pending'")
+        left_pending = cursor.fetchone()[0]
+        conn.close()
+
+    print(f"Backend: {app.get_storage().backend.name}, {args.workers} claimers, {args.entries:,} entries "
+          f"in {elapsed:.2f}s")
+    print(f"Claimed per worker: {', '.join(str(len(ids)) for ids in claimed.values())}")
+    print(f"Distinct entries claimed: {len(counts):,}, claimed more than once: {duplicates:,}, "
+          f"left pending: {left_pending:,}")
+    return 1 if duplicates or left_pending or len(counts) != args.entries else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
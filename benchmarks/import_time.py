@@ -0,0 +1,129 @@
+"""Startup cost benchmark for app.py.
+
+Streamlit re-executes app.py on every interaction, so anything done at module
+level is paid on every rerun. This measures:
+
+- the cold import cost of the heavy modules (pandas, numpy, plotly) on top of
+  streamlit, each in a fresh interpreter; pages that don't use them skip it
+- one schema initialization without the cache (what every rerun used to pay)
+  against the cached call that reruns pay now
+- the median time of a full Dashboard rerun under AppTest
+
+Usage (from the repository root):
+
+    python -m benchmarks.import_time [--repeat 5] [--json]
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, 'app.py')
+
+HEAVY_MODULES = ['numpy', 'pandas', 'plotly.express', 'plotly.graph_objects']
+
+_IMPORT_SNIPPET = '''
+import time
+import streamlit
+started = time.perf_counter()
+import {module}
+print(time.perf_counter() - started)
+'''
+
+def measure_import_cost(module: str, repeat: int = 5) -> float:
+    """Median seconds to import a module in a fresh interpreter with streamlit loaded."""
+    timings = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, '-c', _IMPORT_SNIPPET.format(module=module)],
+            capture_output=True, text=True, check=True
+        )
+        timings.append(float(result.stdout.strip().splitlines()[-1]))
+    return statistics.median(timings)
+
+def load_app(database_url: str):
+    """Import app.py as a module against the given database."""
+    os.environ['DATABASE_URL'] = database_url
+    spec = importlib.util.spec_from_file_location('benchmark_app', APP_PATH)
+    app = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(app)
+    return app
+
+def _median_seconds(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+def measure_schema_init(app, repeat: int = 5) -> Dict[str, float]:
+    """Median seconds for an uncached and a cached init_database() call."""
+    return {
+        'uncached': _median_seconds(app.init_database.__wrapped__, repeat),
+        'cached': _median_seconds(app.init_database, repeat)
+    }
+
+def measure_page_rerun(page: str = "📊 Dashboard", repeat: int = 5) -> float:
+    """Median seconds for a full rerun of one page under AppTest."""
+    from streamlit.testing.v1 import AppTest
+
+    app_test = AppTest.from_file(APP_PATH, default_timeout=60).run()
+    app_test.radio(key="nav_sidebar_page_radio_robust_003").set_value(page).run()
+    return _median_seconds(app_test.run, repeat)
+
+def run(repeat: int = 5) -> Dict:
+    """Run every measurement against a scratch database and return the report."""
+    with tempfile.TemporaryDirectory() as scratch_dir:
+        app = load_app(f"sqlite:///{os.path.join(scratch_dir, 'benchmark.db')}")
+
+        imports = {module: measure_import_cost(module, repeat) for module in HEAVY_MODULES}
+        # Measured together: the modules share dependencies, so the parts don't add up
+        all_imports = measure_import_cost(', '.join(HEAVY_MODULES), repeat)
+        schema_init = measure_schema_init(app, repeat)
+        dashboard_rerun = measure_page_rerun(repeat=repeat)
+
+    return {
+        'repeat': repeat,
+        'heavy_imports_seconds': imports,
+        'cold_start_saved_seconds': all_imports,
+        'schema_init_seconds': schema_init,
+        'per_rerun_saved_seconds': schema_init['uncached'] - schema_init['cached'],
+        'dashboard_rerun_seconds': dashboard_rerun
+    }
+
+def format_report(report: Dict) -> List[str]:
+    """Render the report as aligned text lines."""
+    lines = ["Heavy imports (fresh interpreter, after streamlit):"]
+    for module, seconds in report['heavy_imports_seconds'].items():
+        lines.append(f"  {module:<24}{seconds * 1000:9.1f} ms")
+    lines.append(f"  {'all together (saved)':<24}{report['cold_start_saved_seconds'] * 1000:9.1f} ms")
+    lines.append("Schema initialization:")
+    lines.append(f"  {'uncached':<24}{report['schema_init_seconds']['uncached'] * 1000:9.1f} ms")
+    lines.append(f"  {'cached':<24}{report['schema_init_seconds']['cached'] * 1000:9.1f} ms")
+    lines.append(f"  {'saved per rerun':<24}{report['per_rerun_saved_seconds'] * 1000:9.1f} ms")
+    lines.append(f"Dashboard rerun (AppTest):  {report['dashboard_rerun_seconds'] * 1000:.1f} ms")
+    return lines
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per measurement (median is reported)")
+    parser.add_argument('--json', action='store_true', help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = run(repeat=args.repeat)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print('\n'.join(format_report(report)))
+
+if __name__ == '__main__':
+    main()
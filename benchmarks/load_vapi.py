@@ -0,0 +1,221 @@
+"""Load driver for the calling pipeline, run against the mock Vapi API.
+
+Pushes customers through the app's own calling code and reports:
+- achieved throughput
+- make_vapi_call latency percentiles, which include the app's retries
+- retry counts, from the app's metrics registry
+- the response counts the mock server saw
+
+Modes:
+- direct: make_vapi_call from a thread pool. --bulk-fraction of the customers
+  go out in bulk requests of --bulk-size, the rest as single calls.
+- dispatch: synthetic customers are enqueued and drained through
+  dispatch_call_queue() in batches of --bulk-size, using a scratch database.
+  When every line is full, call outcomes are synced from the mock (which ends
+  calls at once) and the queue is dispatched again, as the campaign runner does.
+Both modes pick caller IDs from the pool a new database is seeded with, or from
+--phone-numbers lines each allowing --line-concurrency calls at once.
+
+Usage (from the repository root):
+
+    python -m benchmarks.load_vapi --customers 2000 --concurrency 16 --bulk-fraction 0.5 --rate-limit 40
+    python -m benchmarks.load_vapi --mode dispatch --customers 1000 --error-rate 0.05
+    python -m benchmarks.load_vapi --mode dispatch --phone-numbers 2 --line-concurrency 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from benchmarks.import_time import load_app
+from benchmarks.mock_vapi import MockVapiServer, add_config_arguments, config_from_args
+
+def percentile(values: List[float], share: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(share * len(ordered))) - 1))]
+
+class CallRecorder:
+    """Wraps make_vapi_call to record the latency and outcome of every request."""
+
+    def __init__(self, make_vapi_call):
+        self.make_vapi_call = make_vapi_call
+        self.latencies: List[float] = []
+        self.outcomes = {'success': 0, 'failed': 0}
+        self.errors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        started = time.perf_counter()
+        result = self.make_vapi_call(*args, **kwargs)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.latencies.append(elapsed)
+            if result.get('success'):
+                self.outcomes['success'] += 1
+            else:
+                self.outcomes['failed'] += 1
+                error = str(result.get('error'))[:80]
+                self.errors[error] = self.errors.get(error, 0) + 1
+        return result
+
+def _customer(index: int) -> Dict:
+    return {"number": f"+1555{index:07d}", "name": f"Load Test {index}"}
+
+def run_direct(app, recorder: CallRecorder, customers: int, bulk_fraction: float, bulk_size: int,
+               concurrency: int) -> int:
+    """Send every customer through make_vapi_call; returns the number of requests."""
+    assistant_id = next(iter(app.ASSISTANTS.values()))
+    bulk_customers = int(customers * bulk_fraction)
+    requests_to_send = [
+        [_customer(index) for index in range(start, min(start + bulk_size, bulk_customers))]
+        for start in range(0, bulk_customers, bulk_size)
+    ] + [[_customer(index)] for index in range(bulk_customers, customers)]
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(lambda batch: recorder('load-test-key', assistant_id, batch), requests_to_send))
+    return len(requests_to_send)
+
+def add_phone_numbers(app, count: int, concurrency: int):
+    """Replace the seeded phone number with `count` load test lines (none: keep the seeded pool)."""
+    if count <= 0:
+        return
+    app.remove_phone_number(app.STATIC_PHONE_NUMBER_ID)
+    for index in range(count):
+        app.add_phone_number(f"load-test-line-{index}", f"+1555{index:07d}", f"Line {index + 1}", concurrency)
+
+def run_dispatch(app, recorder: CallRecorder, customers: int, bulk_size: int) -> tuple:
+    """Enqueue synthetic customers and drain the queue with dispatch_call_queue().
+
+    A pass that leaves customers waiting on full lines is followed by an
+    outcome sync, which frees the slots of ended calls, and another pass.
+    Returns the number of requests and of dispatch passes.
+    """
+    from benchmarks.synthetic_data import generate
+
+    generate(app, customers)
+    assistant_name, assistant_id = next(iter(app.ASSISTANTS.items()))
+    app.enqueue_customer_segment({}, assistant_name, assistant_id)
+
+    # dispatch_call_queue looks make_vapi_call up in the module, so the recorder sees every batch
+    app.make_vapi_call = recorder
+    passes = 0
+    while True:
+        passes += 1
+        totals = app.dispatch_call_queue('load-test-key', batch_size=bulk_size)
+        if not totals['waiting'] or not app.sync_call_outcomes('load-test-key')['updated']:
+            break
+    return len(recorder.latencies), passes
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive load through the app's calling code")
+    parser.add_argument('--mode', choices=['direct', 'dispatch'], default='direct')
+    parser.add_argument('--customers', type=int, default=1000, help="Customers to call")
+    parser.add_argument('--bulk-fraction', type=float, default=0.5, help="Share of customers sent in bulk requests")
+    parser.add_argument('--bulk-size', type=int, default=50, help="Customers per bulk request / dispatch batch")
+    parser.add_argument('--concurrency', type=int, default=8, help="Parallel requests (direct mode)")
+    parser.add_argument('--phone-numbers', type=int, default=0,
+                        help="Replace the seeded phone number pool with this many lines (default: keep it)")
+    parser.add_argument('--line-concurrency', type=int, default=10, help="Concurrent calls each added line allows")
+    parser.add_argument('--max-retries', type=int, default=None, help="Override VAPI_MAX_RETRIES")
+    parser.add_argument('--base-url', default=None, help="Use a running Vapi-compatible server instead of the mock")
+    parser.add_argument('--json', action='store_true', help="Print the report as JSON")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.base_url
+    if not base_url:
+        server = MockVapiServer(config_from_args(args))
+        base_url = server.start()
+
+    os.environ['VAPI_BASE_URL'] = base_url
+    os.environ['METRICS_PORT'] = '0'
+    os.environ['SCHEDULED_JOBS_ENABLED'] = '0'
+    if args.max_retries is not None:
+        os.environ['VAPI_MAX_RETRIES'] = str(args.max_retries)
+
+    with tempfile.TemporaryDirectory() as scratch_dir:
+        app = load_app(f"sqlite:///{os.path.join(scratch_dir, 'load.db')}")
+        add_phone_numbers(app, args.phone_numbers, args.line_concurrency)
+        recorder = CallRecorder(app.make_vapi_call)
+        retries_before = app.get_metrics().get('vapi_request_retries_total').total()
+
+        started = time.perf_counter()
+        if args.mode == 'direct':
+            request_count = run_direct(app, recorder, args.customers, args.bulk_fraction, args.bulk_size, args.concurrency)
+            dispatch_passes = None
+        else:
+            request_count, dispatch_passes = run_dispatch(app, recorder, args.customers, args.bulk_size)
+        elapsed = time.perf_counter() - started
+
+        retries = app.get_metrics().get('vapi_request_retries_total').total() - retries_before
+        app.get_phone_number_pool().refresh()
+        pool = [(number['label'] or number['id'][:8], number['max_concurrency'], number['calls_placed'])
+                for number in app.get_phone_number_pool().statuses()]
+        queue_counts = app.get_call_queue_counts() if args.mode == 'dispatch' else None
+
+    if server:
+        server_stats = server.stats()
+        server.stop()
+    else:
+        server_stats = None
+
+    latencies_ms = [latency * 1000 for latency in recorder.latencies]
+    report = {
+        'mode': args.mode,
+        'base_url': base_url,
+        'customers': args.customers,
+        'phone_numbers': [{'label': label, 'max_concurrency': limit, 'calls_placed': placed}
+                          for label, limit, placed in pool],
+        'requests': request_count,
+        'dispatch_passes': dispatch_passes,
+        'queue': queue_counts,
+        'elapsed_seconds': elapsed,
+        'requests_per_second': request_count / elapsed if elapsed else 0,
+        'customers_per_second': args.customers / elapsed if elapsed else 0,
+        'latency_ms': {
+            'p50': percentile(latencies_ms, 0.50),
+            'p90': percentile(latencies_ms, 0.90),
+            'p99': percentile(latencies_ms, 0.99),
+            'max': max(latencies_ms, default=0),
+            'mean': statistics.mean(latencies_ms) if latencies_ms else 0
+        },
+        'outcomes': recorder.outcomes,
+        'errors': recorder.errors,
+        'retries': retries,
+        'server_responses': server_stats
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"Mode: {args.mode} against {base_url}")
+    print("Phone numbers: " + ", ".join(f"{label} (limit {limit or 'none'}, {placed:,} calls)"
+                                        for label, limit, placed in pool))
+    print(f"Customers: {args.customers:,} in {request_count:,} requests over {elapsed:.2f}s "
+          f"({report['customers_per_second']:.1f} customers/s, {report['requests_per_second']:.1f} requests/s)")
+    latency = report['latency_ms']
+    print(f"Latency ms: p50 {latency['p50']:.1f}  p90 {latency['p90']:.1f}  p99 {latency['p99']:.1f}  "
+          f"max {latency['max']:.1f}")
+    print(f"Outcomes: {recorder.outcomes['success']:,} succeeded, {recorder.outcomes['failed']:,} failed, "
+          f"{retries:,.0f} retries")
+    for error, count in sorted(recorder.errors.items(), key=lambda item: -item[1])[:5]:
+        print(f"  {count:>6,}  {error}")
+    if queue_counts is not None:
+        print(f"Dispatch passes: {dispatch_passes}, queue: {json.dumps(queue_counts, sort_keys=True)}")
+    if server_stats:
+        print(f"Server responses: {json.dumps(server_stats, sort_keys=True)}")
+
+if __name__ == '__main__':
+    sys.exit(main())
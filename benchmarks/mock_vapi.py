@@ -0,0 +1,285 @@
+"""Local mock of the Vapi API for offline load tests.
+
+Serves the endpoints the app uses:
+- POST /call, single or bulk
+- GET /assistant, with an ETag; If-None-Match on an unchanged listing gets a 304
+- PATCH /assistant/<id>, which changes the listing (and so its ETag)
+- GET /call/<id>, answered as an ended call with a random duration and cost
+Latency, error rate and rate limiting (429 with Retry-After) are
+configurable. GET /__stats returns request counts by path and status.
+
+Usage (from the repository root):
+
+    python -m benchmarks.mock_vapi --port 8787 --latency-ms 150 --error-rate 0.02 --rate-limit 50
+    VAPI_BASE_URL=http://localhost:8787 streamlit run app.py
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+ENDED_REASONS = ['customer-ended-call', 'assistant-ended-call', 'customer-did-not-answer', 'customer-busy']
+ENDED_REASON_WEIGHTS = [55, 15, 20, 10]
+COST_PER_MINUTE = 0.12
+
+@dataclass
+class MockVapiConfig:
+    latency_ms: float = 100.0  # Mean response latency
+    jitter_ms: float = 25.0  # Standard deviation of the latency
+    error_rate: float = 0.0  # Share of requests answered with HTTP 500
+    rate_limit: float = 0.0  # Requests per second before 429s (0 = unlimited)
+    burst: int = 10  # Requests allowed at once before the rate limit applies
+    retry_after: float = 1.0  # Retry-After seconds sent with a 429
+    seed: Optional[int] = None
+
+class TokenBucket:
+    """Thread-safe token bucket; take() is False when the caller should be rate limited."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+class MockVapiServer:
+    """A threaded mock Vapi API; start() returns its base URL."""
+
+    def __init__(self, config: MockVapiConfig = None, host: str = '127.0.0.1', port: int = 0):
+        self.config = config or MockVapiConfig()
+        self.bucket = TokenBucket(self.config.rate_limit, self.config.burst) if self.config.rate_limit > 0 else None
+        self.random = random.Random(self.config.seed)
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self.assistants = [_assistant_object(index) for index in range(3)]
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='mock-vapi', daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Response counts as {path: {status: count}}."""
+        with self._lock:
+            return {path: dict(statuses) for path, statuses in self._stats.items()}
+
+    def _count(self, path: str, status: int):
+        with self._lock:
+            statuses = self._stats.setdefault(path, {})
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+
+    def _latency(self) -> float:
+        with self._lock:
+            latency_ms = self.random.gauss(self.config.latency_ms, self.config.jitter_ms)
+        return max(latency_ms, 0) / 1000
+
+    def _ended_call(self, call_id: str) -> Dict:
+        """An ended call with a plausible duration, cost and ended reason."""
+        with self._lock:
+            duration = self.random.randint(5, 300)
+            ended_reason = self.random.choices(ENDED_REASONS, weights=ENDED_REASON_WEIGHTS)[0]
+        ended_at = time.time()
+        return {
+            'id': call_id,
+            'status': 'ended',
+            'endedReason': ended_reason,
+            'startedAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(ended_at - duration)),
+            'endedAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(ended_at)),
+            'cost': round(duration / 60 * COST_PER_MINUTE, 4)
+        }
+
+    def _assistant_listing(self):
+        """The assistants and the ETag of their JSON listing."""
+        with self._lock:
+            assistants = [dict(assistant) for assistant in self.assistants]
+        etag = '"' + hashlib.sha1(json.dumps(assistants, sort_keys=True).encode('utf-8')).hexdigest() + '"'
+        return assistants, etag
+
+    def _update_assistant(self, assistant_id: str, changes: Dict) -> Optional[Dict]:
+        with self._lock:
+            for assistant in self.assistants:
+                if assistant['id'] == assistant_id:
+                    assistant.update({key: value for key, value in changes.items() if key in ('name', 'firstMessage')})
+                    assistant['updatedAt'] = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+                    return dict(assistant)
+        return None
+
+    def _fails(self) -> bool:
+        with self._lock:
+            return self.random.random() < self.config.error_rate
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _send(self, status: int, body, headers: Optional[Dict[str, str]] = None):
+                payload = json.dumps(body).encode('utf-8') if status != 304 else b''
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _route(self, method: str):
+                path = self.path.split('?')[0].rstrip('/')
+                if path == '/__stats':
+                    self._send(200, server.stats())
+                    return
+
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                stats_path = '/call/:id' if path.startswith('/call/') else path
+                if path.startswith('/assistant/'):
+                    stats_path = '/assistant/:id'
+
+                if not self.headers.get('Authorization', '').replace('Bearer', '').strip():
+                    status, response, headers = 401, {'message': 'Missing API key'}, None
+                elif server.bucket and not server.bucket.take():
+                    status, response = 429, {'message': 'Too Many Requests'}
+                    headers = {'Retry-After': f"{server.config.retry_after:g}"}
+                else:
+                    time.sleep(server._latency())
+                    headers = None
+                    if server._fails():
+                        status, response = 500, {'message': 'Internal Server Error'}
+                    else:
+                        status, response, headers = self._respond(method, path, body)
+
+                server._count(f"{method} {stats_path}", status)
+                self._send(status, response, headers)
+
+            def _respond(self, method: str, path: str, body: bytes):
+                if method == 'POST' and path == '/call':
+                    try:
+                        payload = json.loads(body or b'{}')
+                    except ValueError:
+                        return 400, {'message': 'Invalid JSON'}, None
+                    if payload.get('customers'):
+                        return 201, {'results': [_call_object(payload, customer) for customer in payload['customers']]}, None
+                    if payload.get('customer'):
+                        return 201, _call_object(payload, payload['customer']), None
+                    return 400, {'message': 'customer or customers is required'}, None
+                if method == 'GET' and path == '/assistant':
+                    assistants, etag = server._assistant_listing()
+                    if self.headers.get('If-None-Match') == etag:
+                        return 304, None, {'ETag': etag}
+                    return 200, assistants, {'ETag': etag}
+                if method == 'PATCH' and path.startswith('/assistant/'):
+                    try:
+                        changes = json.loads(body or b'{}')
+                    except ValueError:
+                        return 400, {'message': 'Invalid JSON'}, None
+                    assistant = server._update_assistant(path.split('/')[-1], changes)
+                    if assistant is None:
+                        return 404, {'message': 'Assistant not found'}, None
+                    return 200, assistant, None
+                if method == 'GET' and path.startswith('/call/'):
+                    return 200, server._ended_call(path.split('/')[-1]), None
+                return 404, {'message': 'Not Found'}, None
+
+            def do_GET(self):
+                self._route('GET')
+
+            def do_POST(self):
+                self._route('POST')
+
+            def do_PATCH(self):
+                self._route('PATCH')
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+def _assistant_object(index: int) -> Dict:
+    return {
+        'id': str(uuid.UUID(int=index + 1)),
+        'name': f"Mock Assistant {index + 1}",
+        'firstMessage': "Hi, this is a mock assistant.",
+        'model': {'provider': 'openai', 'model': 'gpt-4o'},
+        'voice': {'provider': '11labs', 'voiceId': 'burt'},
+        'updatedAt': '2024-01-01T00:00:00Z'
+    }
+
+def _call_object(payload: Dict, customer: Dict) -> Dict:
+    return {
+        'id': str(uuid.uuid4()),
+        'status': 'queued',
+        'assistantId': payload.get('assistantId'),
+        'phoneNumberId': payload.get('phoneNumberId'),
+        'customer': customer,
+        'createdAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+    }
+
+def add_config_arguments(parser: argparse.ArgumentParser):
+    """Add the MockVapiConfig options to a command line parser."""
+    parser.add_argument('--latency-ms', type=float, default=100.0)
+    parser.add_argument('--jitter-ms', type=float, default=25.0)
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Share of requests answered with HTTP 500")
+    parser.add_argument('--rate-limit', type=float, default=0.0, help="Requests per second before 429s (0 = off)")
+    parser.add_argument('--burst', type=int, default=10)
+    parser.add_argument('--retry-after', type=float, default=1.0)
+    parser.add_argument('--seed', type=int, default=None)
+
+def config_from_args(args) -> MockVapiConfig:
+    return MockVapiConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+        retry_after=args.retry_after,
+        seed=args.seed
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local mock of the Vapi API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8787)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    server = MockVapiServer(config_from_args(args), host=args.host, port=args.port)
+    print(f"Mock Vapi API on {server.base_url} (stats at {server.base_url}/__stats)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+if __name__ == '__main__':
+    main()
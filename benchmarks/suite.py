@@ -0,0 +1,180 @@
+"""Benchmark suite: data-layer and page-render timings at several dataset sizes.
+
+For each size, a scratch SQLite database is filled by benchmarks.synthetic_data.
+The suite then times the app's data-layer functions, followed by headless
+page reruns through Streamlit's AppTest. The result is a JSON report with
+stable keys, so CI can diff it against a baseline.
+
+The scheduled jobs (full lead scoring and call archiving) run as data-layer
+entries, so page timings are not charged for them.
+
+Usage (from the repository root):
+
+    python -m benchmarks.suite --sizes 1k,100k --output benchmark_report.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+from benchmarks.import_time import APP_PATH, load_app
+from benchmarks.synthetic_data import SIZES, generate
+
+PAGES = [
+    "📊 Dashboard",
+    "📞 Make Calls",
+    "📣 Campaigns",
+    "📡 Live Monitor",
+    "👥 CRM Dashboard",
+    "👥 CRM Manager",
+    "📋 Call History",
+    "📝 Transcripts",
+    "📈 Analytics",
+    "⚙️ Settings"
+]
+
+def data_layer_cases(app) -> Dict[str, Callable]:
+    """Data-layer calls to time, keyed by a stable report name."""
+    today = datetime.now().date()
+    segment = {'statuses': ['Hot Lead', 'Warm Lead'], 'min_score': 50, 'tags': ['Enterprise']}
+
+    cases = {
+        f'get_customers_from_db[page,{sort_by}]': (lambda sort_by=sort_by: app.get_customers_from_db(limit=25, sort_by=sort_by))
+        for sort_by in app.CUSTOMER_SORT_OPTIONS
+    }
+    cases.update({
+        'get_customers_from_db[search]': lambda: app.get_customers_from_db(search_term='Smith', limit=25),
+        'count_customers': lambda: app.count_customers(),
+        'count_customers[search]': lambda: app.count_customers(search_term='Smith'),
+        'count_customers[tags_all]': lambda: app.count_customers(tags=['Enterprise', 'High Value'], match_all_tags=True),
+        'count_customer_segment': lambda: app.count_customer_segment(segment),
+        'get_customer_segment': lambda: app.get_customer_segment(segment),
+        'get_customer_timeline[page]': lambda: app.get_customer_timeline('cust_0000000', limit=26),
+        'get_calls_from_db[recent5]': lambda: app.get_calls_from_db(limit=5),
+        'get_call_totals': lambda: app.get_call_totals(),
+        'get_assistant_call_totals': lambda: app.get_assistant_call_totals(),
+        'query_calls[30d]': lambda: app.query_calls(start_date=today - timedelta(days=30), end_date=today),
+        'get_daily_spend[30d]': lambda: app.get_daily_spend('total', '', (today - timedelta(days=29)).isoformat(), today.isoformat()),
+        'budget_guard[refresh]': lambda: app.get_budget_guard().refresh(force=True),
+        'get_live_version': lambda: app.get_live_version(),
+        'get_live_snapshot': lambda: app.get_live_snapshot(),
+        'export_transcripts_to_file[7d]': lambda: os.remove(
+            app.export_transcripts_to_file(start_date=today - timedelta(days=7), end_date=today)[0]
+        ),
+        'customer_analytics[funnel+cohorts]': lambda: customer_analytics(app),
+        'recalculate_lead_scores[full]': lambda: app.recalculate_lead_scores(incremental=False),
+        'recalculate_lead_scores[incremental]': lambda: app.recalculate_lead_scores(incremental=True),
+    })
+    return cases
+
+def customer_analytics(app):
+    """Uncached funnel and cohort reports: load the frames, then one grouped report of each kind."""
+    conn = app.get_db_connection()
+    try:
+        analytics = app.load_customer_analytics(conn)
+    finally:
+        conn.close()
+    app.funnel_report(analytics, 'industry')
+    app.cohort_report(analytics, 'created_month')
+
+def time_call(func: Callable, repeat: int) -> Dict:
+    """Median and max wall time of repeated calls (the first call included)."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return {'median_seconds': statistics.median(timings), 'max_seconds': max(timings), 'runs': repeat}
+
+def _first_line(value) -> str:
+    """First line of an error or element value, for the report."""
+    text = str(value)
+    return text.splitlines()[0][:200] if text else type(value).__name__
+
+def time_pages(pages: List[str], repeat: int, timeout: float) -> Dict[str, Dict]:
+    """Time reruns of each page under AppTest, after one warm-up run."""
+    from streamlit.testing.v1 import AppTest
+
+    results = {}
+    for page in pages:
+        try:
+            app_test = AppTest.from_file(APP_PATH, default_timeout=timeout).run()
+            app_test.radio(key="nav_sidebar_page_radio_robust_003").set_value(page).run()
+            result = time_call(app_test.run, repeat)
+            errors = [_first_line(element.value) for element in list(app_test.error) + list(app_test.exception)]
+            if errors:
+                result['errors'] = errors
+        except Exception as e:
+            result = {'error': _first_line(e)}
+        results[page] = result
+    return results
+
+def run_size(label: str, repeat: int, pages: List[str], page_timeout: float, seed: int) -> Dict:
+    """Generate one dataset size and run every benchmark against it."""
+    import streamlit as st
+
+    with tempfile.TemporaryDirectory() as scratch_dir:
+        st.cache_resource.clear()
+        app = load_app(f"sqlite:///{os.path.join(scratch_dir, 'benchmark.db')}")
+
+        started = time.perf_counter()
+        rows = generate(app, SIZES[label], seed=seed)
+        generate_seconds = time.perf_counter() - started
+
+        data_layer = {name: time_call(func, repeat) for name, func in data_layer_cases(app).items()}
+        data_layer['archive_old_calls'] = time_call(lambda: app.archive_old_calls(), 1)
+
+        return {
+            'customers': SIZES[label],
+            'rows': rows,
+            'generate_seconds': generate_seconds,
+            'data_layer': data_layer,
+            'pages': time_pages(pages, repeat, page_timeout)
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the benchmark suite and write a JSON report")
+    parser.add_argument('--sizes', default='1k', help=f"Comma-separated sizes from {', '.join(SIZES)}")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per measurement (median is reported)")
+    parser.add_argument('--pages', default=','.join(PAGES), help="Comma-separated pages to render ('' for none)")
+    parser.add_argument('--page-timeout', type=float, default=300, help="Seconds before a page render is abandoned")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='benchmark_report.json')
+    args = parser.parse_args()
+
+    sizes = [size.strip().lower() for size in args.sizes.split(',') if size.strip()]
+    unknown = [size for size in sizes if size not in SIZES]
+    if unknown:
+        parser.error(f"Unknown sizes: {', '.join(unknown)}")
+    pages = [page for page in args.pages.split(',') if page]
+
+    # Keep the benchmark process quiet: no metrics endpoint, no background jobs, no rerun profiling
+    os.environ['METRICS_PORT'] = '0'
+    os.environ['SCHEDULED_JOBS_ENABLED'] = '0'
+    os.environ.pop('VAPI_PROFILE', None)
+
+    report = {
+        'generated_at': datetime.now().isoformat(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'seed': args.seed,
+        'sizes': {}
+    }
+    for size in sizes:
+        print(f"Running {size} ...", file=sys.stderr)
+        report['sizes'][size] = run_size(size, args.repeat, pages, args.page_timeout, args.seed)
+
+    with open(args.output, 'w') as report_file:
+        json.dump(report, report_file, indent=2, sort_keys=True)
+    print(f"Wrote {args.output}", file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
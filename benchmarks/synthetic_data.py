@@ -0,0 +1,206 @@
+"""Synthetic dataset generator for benchmarks.
+
+Fills a scratch SQLite database, whose schema was already created by
+app.init_database(), with realistic customers, tags, orders, calls (with
+transcripts) and interactions. The output is deterministic for a given size
+and seed.
+
+Triggers are dropped during the bulk load. Afterwards the app's own backfill
+functions rebuild the aggregates, rollups, cost ledger and interaction
+timelines, and the triggers are recreated.
+
+Usage (from the repository root):
+
+    python -m benchmarks.synthetic_data --size 100k --output scratch.db
+"""
+
+import argparse
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List
+
+SIZES = {'1k': 1_000, '100k': 100_000, '1m': 1_000_000}
+
+ORDERS_PER_CUSTOMER = 2
+CALLS_PER_CUSTOMER = 1
+INTERACTIONS_PER_CUSTOMER = 0.5
+HISTORY_DAYS = 365
+BATCH_SIZE = 10_000
+
+FIRST_NAMES = ['James', 'Mary', 'Robert', 'Patricia', 'John', 'Jennifer', 'Michael', 'Linda',
+               'David', 'Elizabeth', 'William', 'Barbara', 'Richard', 'Susan', 'Joseph', 'Jessica']
+LAST_NAMES = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis',
+              'Rodriguez', 'Martinez', 'Hernandez', 'Lopez', 'Wilson', 'Anderson', 'Thomas', 'Taylor']
+COMPANY_WORDS = ['Tech', 'Global', 'Prime', 'Blue', 'Summit', 'Apex', 'Bright', 'Urban', 'Nova', 'Green']
+COMPANY_SUFFIXES = ['Solutions', 'Corp', 'Labs', 'Group', 'Partners', 'Industries', 'Systems']
+POSITIONS = ['CEO', 'CTO', 'Founder', 'Manager', 'Director', 'VP Sales', 'Operations Manager']
+INDUSTRIES = ['Technology', 'Retail', 'Manufacturing', 'Healthcare', 'Finance', 'Education', 'Real Estate']
+SOURCES = ['Website', 'Referral', 'Event', 'Cold Outreach', 'Partner', 'Advertising']
+STATES = [('CA', 'US'), ('NY', 'US'), ('TX', 'US'), ('FL', 'US'), ('IL', 'US'), ('WA', 'US'),
+          ('ON', 'CA'), ('BC', 'CA'), ('NSW', 'AU'), ('LND', 'GB')]
+TAG_POOL = ['Enterprise', 'SMB', 'Startup', 'High Value', 'Decision Maker', 'Repeat Customer',
+            'Budget Conscious', 'Marketing', 'Retail', 'Manufacturing', 'Healthcare', 'Demo']
+PRODUCTS = ['Enterprise Package', 'Basic Package', 'Add-on Services', 'Marketing Suite', 'Automation Tools']
+CALL_STATUSES = [('completed', 60), ('failed', 15), ('no-answer', 15), ('busy', 10)]
+INTERACTION_TYPES = ['Call', 'Email', 'Meeting', 'Note']
+TRANSCRIPT_WORDS = ['hello', 'thanks', 'calling', 'about', 'your', 'account', 'pricing', 'demo',
+                    'follow', 'up', 'next', 'week', 'schedule', 'meeting', 'question', 'support']
+
+def _batched(rows: Iterator[tuple], size: int = BATCH_SIZE) -> Iterator[List[tuple]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def _timestamp(rng: random.Random, now: datetime) -> str:
+    return (now - timedelta(seconds=rng.randint(0, HISTORY_DAYS * 86400))).isoformat()
+
+def _phone(index: int) -> str:
+    return f"+1{2000000000 + index}"
+
+def _customer_rows(rng: random.Random, count: int, now: datetime, statuses: List[str]) -> Iterator[tuple]:
+    for index in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        company = f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_SUFFIXES)}"
+        state, country = rng.choice(STATES)
+        tags = ','.join(rng.sample(TAG_POOL, rng.randint(1, 3)))
+        created_at = _timestamp(rng, now)
+        yield (
+            f"cust_{index:07d}", f"{first} {last}", f"{first.lower()}.{last.lower()}{index}@example.com",
+            _phone(index), company, rng.choice(POSITIONS), rng.randint(0, 100), rng.choice(statuses),
+            _timestamp(rng, now)[:10], f"Synthetic customer {index}", 0, tags, created_at, created_at,
+            state, country, rng.choice(INDUSTRIES), rng.choice(SOURCES)
+        )
+
+def _order_rows(rng: random.Random, customers: int, now: datetime, statuses: List[str]) -> Iterator[tuple]:
+    order_index = 0
+    for customer_index in range(customers):
+        for _ in range(rng.randint(0, ORDERS_PER_CUSTOMER * 2)):
+            amount = round(rng.uniform(50, 5000), 2)
+            order_date = _timestamp(rng, now)
+            yield (
+                f"ORD-{order_index:08d}", f"cust_{customer_index:07d}", order_date[:10], amount,
+                rng.choice(statuses), rng.choice(PRODUCTS), 1, amount, order_date, order_date
+            )
+            order_index += 1
+
+def _transcript(rng: random.Random, positive_words: List[str], negative_words: List[str]) -> str:
+    words = rng.choices(TRANSCRIPT_WORDS, k=rng.randint(20, 80))
+    words += rng.choices(positive_words + negative_words, k=rng.randint(1, 6))
+    rng.shuffle(words)
+    return ' '.join(words)
+
+def _call_rows(rng: random.Random, customers: int, now: datetime, assistants: Dict[str, str],
+               positive_words: List[str], negative_words: List[str]) -> Iterator[tuple]:
+    assistant_names = list(assistants)
+    statuses = [status for status, _ in CALL_STATUSES]
+    weights = [weight for _, weight in CALL_STATUSES]
+    for index in range(customers * CALLS_PER_CUSTOMER):
+        customer_index = rng.randrange(customers)
+        assistant_name = rng.choice(assistant_names)
+        status = rng.choices(statuses, weights)[0]
+        duration = rng.randint(30, 900) if status == 'completed' else 0
+        created_at = _timestamp(rng, now)
+        yield (
+            f"call_{index:08d}", created_at, "Single Call", assistant_name, assistants[assistant_name],
+            _phone(customer_index), f"Customer {customer_index}", "", f"vapi_{index:08d}", status, "",
+            _transcript(rng, positive_words, negative_words) if status == 'completed' else "",
+            "", "", duration, round(duration * 0.0015, 4), created_at
+        )
+
+def _interaction_rows(rng: random.Random, customers: int, now: datetime) -> Iterator[tuple]:
+    for index in range(int(customers * INTERACTIONS_PER_CUSTOMER)):
+        interaction_date = _timestamp(rng, now)
+        yield (
+            f"int_{index:08d}", f"cust_{rng.randrange(customers):07d}", rng.choice(INTERACTION_TYPES),
+            interaction_date, "Synthetic interaction", rng.choice(['positive', 'neutral', 'negative']),
+            "", "benchmark", interaction_date
+        )
+
+def generate(app, customers: int, seed: int = 42) -> Dict[str, int]:
+    """Load a synthetic dataset into the app's (SQLite) database and return row counts per table."""
+    backend = app.get_storage().backend
+    if backend.name != "SQLite":
+        raise ValueError("The synthetic data generator writes to scratch SQLite databases only")
+
+    rng = random.Random(seed)
+    now = datetime.now()
+    conn = backend.connect()
+    cursor = conn.cursor()
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+    for (trigger_name,) in cursor.fetchall():
+        cursor.execute(f'DROP TRIGGER IF EXISTS {trigger_name}')
+
+    for batch in _batched(_customer_rows(rng, customers, now, app.CUSTOMER_STATUSES)):
+        cursor.executemany('''
+            INSERT INTO customers (id, name, email, phone, company, position, lead_score, status,
+                                   last_contact, notes, total_value, tags, created_at, updated_at,
+                                   state, country, industry, source)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', batch)
+    app.backfill_customer_tags(cursor)
+
+    for batch in _batched(_order_rows(rng, customers, now, app.ORDER_STATUSES)):
+        cursor.executemany('''
+            INSERT INTO orders (id, customer_id, order_date, amount, status, product, quantity, total,
+                                created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', batch)
+
+    columns = ', '.join(app.CALL_COLUMNS)
+    placeholders = ', '.join('?' for _ in app.CALL_COLUMNS)
+    for batch in _batched(_call_rows(rng, customers, now, app.ASSISTANTS,
+                                     app.POSITIVE_WORDS, app.NEGATIVE_WORDS)):
+        cursor.executemany(f'INSERT INTO calls ({columns}) VALUES ({placeholders})', batch)
+
+    for batch in _batched(_interaction_rows(rng, customers, now)):
+        cursor.executemany('''
+            INSERT INTO customer_interactions (id, customer_id, interaction_type, interaction_date, notes,
+                                               outcome, next_action, created_by, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', batch)
+
+    app.backfill_customer_aggregates(cursor)
+    app.backfill_customer_interactions(cursor)
+    cursor.execute('DELETE FROM call_rollups')
+    app.backfill_call_rollups(cursor)
+    cursor.execute('DELETE FROM cost_ledger')
+    app.backfill_cost_ledger(cursor)
+    backend.create_triggers(cursor)
+    conn.commit()
+
+    counts = {}
+    for table in ('customers', 'customer_tags', 'orders', 'calls', 'customer_interactions'):
+        cursor.execute(f'SELECT COUNT(*) FROM {table}')
+        counts[table] = cursor.fetchone()[0]
+    conn.close()
+
+    return counts
+
+def main():
+    from benchmarks.import_time import load_app
+
+    parser = argparse.ArgumentParser(description="Generate a synthetic benchmark database")
+    parser.add_argument('--size', choices=sorted(SIZES), default='1k')
+    parser.add_argument('--output', default='benchmark.db', help="SQLite file to create")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    if os.path.exists(args.output):
+        parser.error(f"{args.output} already exists")
+
+    os.environ.setdefault('METRICS_PORT', '0')
+    os.environ.setdefault('SCHEDULED_JOBS_ENABLED', '0')
+    app = load_app(f"sqlite:///{os.path.abspath(args.output)}")
+    counts = generate(app, SIZES[args.size], seed=args.seed)
+    for table, count in counts.items():
+        print(f"{table:<24}{count:>12,}")
+
+if __name__ == '__main__':
+    main()